@@ -3,98 +3,164 @@
 import json
 import argparse
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Set, Any
+from typing import Dict, List, Tuple, Any, Iterable, Iterator
 from datetime import datetime
 
+try:
+    # Optional: stream Results one at a time instead of loading the whole scan
+    import ijson  # type: ignore[import-not-found]
+except ImportError:
+    ijson = None
+
+try:
+    # Optional: faster JSON parsing/serialization than the stdlib json module
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Identity of a finding: (vulnerability id, package, installed version, target)
+VulnerabilityKey = Tuple[str, str, str, str]
+
+# Integer rank for each Trivy severity, higher is more severe
+SEVERITY_ORDER: Dict[str, int] = {
+    "CRITICAL": 5,
+    "HIGH": 4,
+    "MEDIUM": 3,
+    "LOW": 2,
+    "NEGLIGIBLE": 1,
+    "UNKNOWN": 0
+}
+
+# Severities reported in high_priority_new_vulnerabilities
+HIGH_PRIORITY_SEVERITIES = frozenset(("CRITICAL", "HIGH"))
+
+# CVSS sources consulted in order of preference
+CVSS_SOURCES = ("nvd", "redhat", "ubuntu")
+
+
+@dataclass(slots=True, frozen=True)
+class Vulnerability:
+    """A single vulnerability finding from a Trivy scan"""
+    id: str
+    package: str
+    installed_version: str
+    fixed_version: str
+    severity: str
+    severity_code: int
+    title: str
+    description: str
+    target: str
+    cvss_score: float
+    primary_url: str
+    published_date: str
+    last_modified_date: str
+
+
+def vulnerability_record(vuln: Vulnerability) -> Dict[str, Any]:
+    """Report form of a Vulnerability; severity_code is only used for ranking"""
+    record = asdict(vuln)
+    del record["severity_code"]
+    return record
+
 
 class ScanComparator:
     """Compare two Trivy scan results and identify changes"""
     
-    def __init__(self):
-        self.severity_order = {
-            "CRITICAL": 5,
-            "HIGH": 4,
-            "MEDIUM": 3,
-            "LOW": 2,
-            "NEGLIGIBLE": 1,
-            "UNKNOWN": 0
-        }
+    def __init__(self) -> None:
+        self.severity_order = SEVERITY_ORDER
     
-    def extract_vulnerabilities(self, scan_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    def iter_results(self, scan_file: Path) -> Iterator[Dict[str, Any]]:
+        """Yield Trivy Result objects from a scan file one at a time"""
+        with open(scan_file, "rb") as f:
+            if ijson is not None:
+                yield from ijson.items(f, "Results.item", use_float=True)
+            elif orjson is not None:
+                yield from orjson.loads(f.read()).get("Results") or []
+            else:
+                yield from json.load(f).get("Results") or []
+    
+    def extract_vulnerabilities(self, results: Iterable[Dict[str, Any]]) -> Dict[VulnerabilityKey, Vulnerability]:
         """Extract vulnerabilities from Trivy scan results"""
         vulnerabilities = {}
         
-        for result in scan_data.get("Results", []):
+        for result in results:
             target = result.get("Target", "unknown")
             
             for vuln in result.get("Vulnerabilities", []):
                 vuln_id = vuln.get("VulnerabilityID", "")
                 pkg_name = vuln.get("PkgName", "")
                 installed_version = vuln.get("InstalledVersion", "")
+                severity = sys.intern(vuln.get("Severity") or "UNKNOWN")
                 
                 # Create unique key for vulnerability
-                key = f"{vuln_id}:{pkg_name}:{installed_version}:{target}"
+                key = (vuln_id, pkg_name, installed_version, target)
                 
-                vulnerabilities[key] = {
-                    "id": vuln_id,
-                    "package": pkg_name,
-                    "installed_version": installed_version,
-                    "fixed_version": vuln.get("FixedVersion", ""),
-                    "severity": vuln.get("Severity", "UNKNOWN"),
-                    "title": vuln.get("Title", ""),
-                    "description": vuln.get("Description", ""),
-                    "target": target,
-                    "cvss_score": self.get_cvss_score(vuln),
-                    "primary_url": vuln.get("PrimaryURL", ""),
-                    "published_date": vuln.get("PublishedDate", ""),
-                    "last_modified_date": vuln.get("LastModifiedDate", "")
-                }
+                vulnerabilities[key] = Vulnerability(
+                    id=vuln_id,
+                    package=pkg_name,
+                    installed_version=installed_version,
+                    fixed_version=vuln.get("FixedVersion", ""),
+                    severity=severity,
+                    severity_code=self.severity_order.get(severity, 0),
+                    title=vuln.get("Title", ""),
+                    description=vuln.get("Description", ""),
+                    target=target,
+                    cvss_score=self.get_cvss_score(vuln),
+                    primary_url=vuln.get("PrimaryURL", ""),
+                    published_date=vuln.get("PublishedDate", ""),
+                    last_modified_date=vuln.get("LastModifiedDate", "")
+                )
         
         return vulnerabilities
     
     def get_cvss_score(self, vuln: Dict[str, Any]) -> float:
         """Extract CVSS score from vulnerability data"""
-        cvss = vuln.get("CVSS", {})
+        cvss = vuln.get("CVSS")
+        if not cvss:
+            return 0.0
         
         # Try different CVSS sources
-        for source in ["nvd", "redhat", "ubuntu"]:
-            if source in cvss:
-                score = cvss[source].get("V3Score") or cvss[source].get("V2Score")
-                if score:
-                    return float(score)
+        for source in CVSS_SOURCES:
+            scores = cvss.get(source)
+            if scores and (score := scores.get("V3Score") or scores.get("V2Score")):
+                return float(score)
         
         return 0.0
     
-    def compare_scans(self, previous_file: Path, current_file: Path) -> Dict[str, Any]:
-        """Compare two scan files and return differences"""
-        
-        # Load previous scan
+    def load_vulnerabilities(self, scan_file: Path, label: str) -> Dict[VulnerabilityKey, Vulnerability]:
+        """Load a scan file and extract its vulnerabilities, empty on error"""
         try:
-            with open(previous_file) as f:
-                previous_data = json.load(f)
-            previous_vulns = self.extract_vulnerabilities(previous_data)
+            return self.extract_vulnerabilities(self.iter_results(scan_file))
         except Exception as e:
-            print(f"Error loading previous scan: {e}", file=sys.stderr)
-            previous_vulns = {}
+            print(f"Error loading {label} scan: {e}", file=sys.stderr)
+            return {}
+    
+    def compare_scans(self, previous_file: Path, current_file: Path) -> Dict[str, Any]:
+        """Compare two scan files and return differences"""
         
-        # Load current scan
-        try:
-            with open(current_file) as f:
-                current_data = json.load(f)
-            current_vulns = self.extract_vulnerabilities(current_data)
-        except Exception as e:
-            print(f"Error loading current scan: {e}", file=sys.stderr)
-            current_vulns = {}
+        # Load both scans concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            previous_future = executor.submit(self.load_vulnerabilities, previous_file, "previous")
+            current_future = executor.submit(self.load_vulnerabilities, current_file, "current")
+            previous_vulns = previous_future.result()
+            current_vulns = current_future.result()
         
         # Find differences
-        previous_keys = set(previous_vulns.keys())
-        current_keys = set(current_vulns.keys())
+        previous_keys = previous_vulns.keys()
+        current_keys = current_vulns.keys()
         
         new_vuln_keys = current_keys - previous_keys
         resolved_vuln_keys = previous_keys - current_keys
         unchanged_vuln_keys = previous_keys & current_keys
         
+        new_vulns = [current_vulns[key] for key in new_vuln_keys]
+        resolved_vulns = [previous_vulns[key] for key in resolved_vuln_keys]
+        
         # Build detailed comparison
         comparison = {
             "comparison_metadata": {
@@ -105,81 +171,80 @@ class ScanComparator:
                 "resolved_vulnerabilities_count": len(resolved_vuln_keys),
                 "unchanged_vulnerabilities_count": len(unchanged_vuln_keys)
             },
-            "new_vulnerabilities": [current_vulns[key] for key in new_vuln_keys],
-            "resolved_vulnerabilities": [previous_vulns[key] for key in resolved_vuln_keys],
-            "unchanged_vulnerabilities": [current_vulns[key] for key in unchanged_vuln_keys],
-            "summary": self.generate_summary(new_vuln_keys, resolved_vuln_keys, current_vulns, previous_vulns)
+            "new_vulnerabilities": new_vulns,
+            "resolved_vulnerabilities": resolved_vulns,
+            "summary": self.generate_summary(new_vulns, resolved_vulns)
         }
         
         # Add severity breakdown for new vulnerabilities
-        if new_vuln_keys:
-            comparison["new_vulnerabilities_by_severity"] = self.categorize_by_severity(
-                [current_vulns[key] for key in new_vuln_keys]
-            )
+        if new_vulns:
+            comparison["new_vulnerabilities_by_severity"] = self.categorize_by_severity(new_vulns)
         
         # Add high-priority new vulnerabilities (CRITICAL/HIGH)
         high_priority_new = [
-            current_vulns[key] for key in new_vuln_keys 
-            if current_vulns[key]["severity"] in ["CRITICAL", "HIGH"]
+            v for v in new_vulns if v.severity in HIGH_PRIORITY_SEVERITIES
         ]
         comparison["high_priority_new_vulnerabilities"] = high_priority_new
         
         return comparison
     
-    def categorize_by_severity(self, vulnerabilities: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    def categorize_by_severity(self, vulnerabilities: List[Vulnerability]) -> Dict[str, List[Vulnerability]]:
         """Categorize vulnerabilities by severity"""
-        by_severity = {}
+        by_severity = defaultdict(list)
         
         for vuln in vulnerabilities:
-            severity = vuln["severity"]
-            if severity not in by_severity:
-                by_severity[severity] = []
-            by_severity[severity].append(vuln)
+            by_severity[vuln.severity].append(vuln)
         
-        return by_severity
+        return dict(by_severity)
     
-    def generate_summary(self, new_keys: Set[str], resolved_keys: Set[str], 
-                        current_vulns: Dict[str, Any], previous_vulns: Dict[str, Any]) -> Dict[str, Any]:
+    def count_by_severity(self, vulnerabilities: List[Vulnerability]) -> List[int]:
+        """Count vulnerabilities per severity, indexed by severity code"""
+        counts = [0] * len(SEVERITY_ORDER)
+        for vuln in vulnerabilities:
+            counts[vuln.severity_code] += 1
+        return counts
+    
+    def severity_counts(self, counts: List[int]) -> Dict[str, int]:
+        """Build the per-severity count block from per-code counts"""
+        return {
+            "critical": counts[SEVERITY_ORDER["CRITICAL"]],
+            "high": counts[SEVERITY_ORDER["HIGH"]],
+            "medium": counts[SEVERITY_ORDER["MEDIUM"]],
+            "low": counts[SEVERITY_ORDER["LOW"]],
+            "negligible": counts[SEVERITY_ORDER["NEGLIGIBLE"]]
+        }
+    
+    def generate_summary(self, new_vulns: List[Vulnerability],
+                        resolved_vulns: List[Vulnerability]) -> Dict[str, Any]:
         """Generate a human-readable summary of changes"""
         
-        summary = {
-            "has_new_vulnerabilities": len(new_keys) > 0,
-            "has_resolved_vulnerabilities": len(resolved_keys) > 0,
-            "net_change": len(new_keys) - len(resolved_keys)
+        summary: Dict[str, Any] = {
+            "has_new_vulnerabilities": len(new_vulns) > 0,
+            "has_resolved_vulnerabilities": len(resolved_vulns) > 0,
+            "net_change": len(new_vulns) - len(resolved_vulns)
         }
         
-        if new_keys:
-            new_vulns = [current_vulns[key] for key in new_keys]
-            summary["new_vulnerabilities_summary"] = {
-                "critical": len([v for v in new_vulns if v["severity"] == "CRITICAL"]),
-                "high": len([v for v in new_vulns if v["severity"] == "HIGH"]),
-                "medium": len([v for v in new_vulns if v["severity"] == "MEDIUM"]),
-                "low": len([v for v in new_vulns if v["severity"] == "LOW"]),
-                "negligible": len([v for v in new_vulns if v["severity"] == "NEGLIGIBLE"])
-            }
+        new_counts = self.count_by_severity(new_vulns)
+        
+        if new_vulns:
+            summary["new_vulnerabilities_summary"] = self.severity_counts(new_counts)
             
             # Find highest severity new vulnerability
-            highest_severity_vuln = max(new_vulns, key=lambda v: self.severity_order.get(v["severity"], 0))
+            highest_severity_vuln = max(new_vulns, key=attrgetter("severity_code"))
             summary["highest_severity_new"] = {
-                "id": highest_severity_vuln["id"],
-                "severity": highest_severity_vuln["severity"],
-                "package": highest_severity_vuln["package"],
-                "cvss_score": highest_severity_vuln["cvss_score"]
+                "id": highest_severity_vuln.id,
+                "severity": highest_severity_vuln.severity,
+                "package": highest_severity_vuln.package,
+                "cvss_score": highest_severity_vuln.cvss_score
             }
         
-        if resolved_keys:
-            resolved_vulns = [previous_vulns[key] for key in resolved_keys]
-            summary["resolved_vulnerabilities_summary"] = {
-                "critical": len([v for v in resolved_vulns if v["severity"] == "CRITICAL"]),
-                "high": len([v for v in resolved_vulns if v["severity"] == "HIGH"]),
-                "medium": len([v for v in resolved_vulns if v["severity"] == "MEDIUM"]),
-                "low": len([v for v in resolved_vulns if v["severity"] == "LOW"]),
-                "negligible": len([v for v in resolved_vulns if v["severity"] == "NEGLIGIBLE"])
-            }
+        if resolved_vulns:
+            resolved_counts = self.count_by_severity(resolved_vulns)
+            summary["resolved_vulnerabilities_summary"] = self.severity_counts(resolved_counts)
         
         # Risk assessment
-        critical_new = len([v for v in [current_vulns[key] for key in new_keys] if v["severity"] == "CRITICAL"])
-        high_new = len([v for v in [current_vulns[key] for key in new_keys] if v["severity"] == "HIGH"])
+        critical_new = new_counts[SEVERITY_ORDER["CRITICAL"]]
+        high_new = new_counts[SEVERITY_ORDER["HIGH"]]
         
         if critical_new > 0:
             summary["risk_level"] = "CRITICAL"
@@ -187,7 +252,7 @@ class ScanComparator:
         elif high_new > 0:
             summary["risk_level"] = "HIGH"
             summary["recommended_action"] = "High priority vulnerabilities require prompt remediation"
-        elif len(new_keys) > 0:
+        elif len(new_vulns) > 0:
             summary["risk_level"] = "MEDIUM"
             summary["recommended_action"] = "New vulnerabilities detected - review and plan remediation"
         else:
@@ -197,7 +262,7 @@ class ScanComparator:
         return summary
 
 
-def main():
+def main() -> None:
     parser = argparse.ArgumentParser(description="Compare Trivy scan results")
     parser.add_argument("--previous", type=Path, required=True, 
                        help="Previous scan results JSON file")
@@ -222,8 +287,18 @@ def main():
     comparison_result = comparator.compare_scans(args.previous, args.current)
     
     # Write results
-    with open(args.output, 'w') as f:
-        json.dump(comparison_result, f, indent=2)
+    if orjson is not None:
+        with open(args.output, 'wb') as f:
+            # Serialize records through asdict: orjson's native dataclass support
+            # misreads the field layout of mypyc-compiled classes
+            f.write(orjson.dumps(
+                comparison_result,
+                default=vulnerability_record,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS
+            ))
+    else:
+        with open(args.output, 'w') as f:
+            json.dump(comparison_result, f, indent=2, default=vulnerability_record)
     
     if args.verbose:
         metadata = comparison_result["comparison_metadata"]
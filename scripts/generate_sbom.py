@@ -1,16 +1,95 @@
 #!/usr/bin/env python3
 """Enhanced SBOM generation with SLSA metadata"""
 import subprocess
+import configparser
 import re
 import json
 import sys
 import os
-from datetime import datetime
+import functools
+from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    # Optional: faster JSON parsing/serialization than the stdlib json module
+    import orjson
+except ImportError:
+    orjson = None
 
+# Characters stripped from GitHub environment values before they enter the SBOM
+UNSAFE_ENV_CHARS = re.compile(r'[^a-zA-Z0-9._/@:-]')
+
+# Build properties that are the same for every SBOM
+STATIC_BUILD_PROPERTIES = (
+    ("build.tool", "github-actions"),
+    ("build.platform", "GitHub Actions"),
+    ("slsa.buildLevel", "3")
+)
+
+# SBOM property name -> GitHub Actions environment variable
+GITHUB_ENV_PROPERTIES = (
+    ("github.workflow", "GITHUB_WORKFLOW"),
+    ("github.run.id", "GITHUB_RUN_ID"),
+    ("github.run.number", "GITHUB_RUN_NUMBER"),
+    ("github.actor", "GITHUB_ACTOR")
+)
+
+
+def read_git_dir_info():
+    """Read HEAD commit and origin URL directly from .git, None if not possible"""
+    cwd = Path.cwd()
+    git_dir = next((d / ".git" for d in (cwd, *cwd.parents) if (d / ".git").exists()), None)
+    # Submodules and worktrees have a .git file pointing elsewhere; leave them to git
+    if git_dir is None or not git_dir.is_dir():
+        return None
+    
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+        if head.startswith("ref: "):
+            ref = head[len("ref: "):]
+            ref_file = git_dir / ref
+            if ref_file.is_file():
+                commit_sha = ref_file.read_text().strip()
+            else:
+                # Ref may only exist in packed-refs ("<sha> <ref>" per line)
+                packed_refs = (git_dir / "packed-refs").read_text().splitlines()
+                commit_sha = next(line.split(" ", 1)[0] for line in packed_refs
+                                  if line.endswith(f" {ref}"))
+        else:
+            commit_sha = head
+        
+        config = configparser.ConfigParser(strict=False, interpolation=None, allow_no_value=True)
+        config.read(git_dir / "config")
+        repo_url = config.get('remote "origin"', "url", fallback=None)
+    except (OSError, StopIteration, configparser.Error):
+        return None
+    
+    if not commit_sha or not repo_url:
+        return None
+    
+    return {
+        "commit_sha": commit_sha,
+        "repository_url": repo_url
+    }
+
+
+@functools.lru_cache(maxsize=1)
 def get_git_info():
     """Get Git repository information"""
+    # Plain checkouts can be read without forking git at all. This reflects the
+    # checkout on disk, which may differ from GITHUB_SHA after a git checkout.
+    git_dir_info = read_git_dir_info()
+    if git_dir_info is not None:
+        return git_dir_info
+    
+    # GitHub Actions exposes the commit and repository, no need to fork git
+    if "GITHUB_SHA" in os.environ and "GITHUB_REPOSITORY" in os.environ:
+        server_url = os.environ.get("GITHUB_SERVER_URL", "https://github.com")
+        return {
+            "commit_sha": os.environ["GITHUB_SHA"],
+            "repository_url": f"{server_url}/{os.environ['GITHUB_REPOSITORY']}"
+        }
+    
     try:
         commit_sha = subprocess.check_output(
             ["git", "rev-parse", "HEAD"], 
@@ -33,26 +112,37 @@ def get_git_info():
         }
 
 
+def safe_env_get(key, default="unknown", max_length=256):
+    """Safely get environment variable with validation"""
+    value = os.environ.get(key, default)
+    if not isinstance(value, str):
+        return default
+    # Remove potentially dangerous characters
+    safe_value = UNSAFE_ENV_CHARS.sub('', value)
+    return safe_value[:max_length] if safe_value else default
+
+
 def generate_enhanced_sbom():
     """Generate SBOM with enhanced metadata and SLSA properties"""
     
+    # Single timezone-aware timestamp shared by every field of this build
+    build_timestamp = datetime.now(timezone.utc).isoformat()
+    
     # Run cyclonedx-bom to generate base SBOM
     result = subprocess.run(
         ["poetry", "run", "cyclonedx-py", "poetry", "-o", "-", "--of", "json"],
-        capture_output=True,
-        text=True
+        capture_output=True
     )
     
     if result.returncode != 0:
-        print(f"Error generating SBOM: {result.stderr}", file=sys.stderr)
+        print(f"Error generating SBOM: {result.stderr.decode(errors='replace')}", file=sys.stderr)
         sys.exit(1)
     
-    # Parse base SBOM
-    sbom = json.loads(result.stdout)
+    # Parse base SBOM straight from the captured bytes
+    sbom = orjson.loads(result.stdout) if orjson is not None else json.loads(result.stdout)
     
     # Get environment information
     git_info = get_git_info()
-    build_timestamp = datetime.now().isoformat()
     
     # Enhance metadata
     if "metadata" not in sbom:
@@ -65,63 +155,18 @@ def generate_enhanced_sbom():
         sbom["metadata"]["properties"] = []
     
     slsa_properties = [
-        {
-            "name": "build.timestamp",
-            "value": build_timestamp
-        },
-        {
-            "name": "build.tool",
-            "value": "github-actions"
-        },
-        {
-            "name": "build.platform",
-            "value": "GitHub Actions"
-        },
-        {
-            "name": "slsa.buildLevel",
-            "value": "3"
-        },
-        {
-            "name": "source.commit.sha",
-            "value": git_info["commit_sha"]
-        },
-        {
-            "name": "source.repository.url", 
-            "value": git_info["repository_url"]
-        }
+        {"name": "build.timestamp", "value": build_timestamp},
+        *({"name": name, "value": value} for name, value in STATIC_BUILD_PROPERTIES),
+        {"name": "source.commit.sha", "value": git_info["commit_sha"]},
+        {"name": "source.repository.url", "value": git_info["repository_url"]}
     ]
     
     # Add GitHub Actions specific metadata if available
     if "GITHUB_ACTIONS" in os.environ:
-        # Safely get and validate environment variables
-        def safe_env_get(key, default="unknown", max_length=256):
-            """Safely get environment variable with validation"""
-            value = os.environ.get(key, default)
-            if not isinstance(value, str):
-                return default
-            # Remove potentially dangerous characters
-            safe_value = re.sub(r'[^a-zA-Z0-9._/@:-]', '', value)
-            return safe_value[:max_length] if safe_value else default
-        
-        github_properties = [
-            {
-                "name": "github.workflow",
-                "value": safe_env_get("GITHUB_WORKFLOW")
-            },
-            {
-                "name": "github.run.id",
-                "value": safe_env_get("GITHUB_RUN_ID")
-            },
-            {
-                "name": "github.run.number",
-                "value": safe_env_get("GITHUB_RUN_NUMBER")
-            },
-            {
-                "name": "github.actor",
-                "value": safe_env_get("GITHUB_ACTOR")
-            }
-        ]
-        slsa_properties.extend(github_properties)
+        slsa_properties.extend(
+            {"name": name, "value": safe_env_get(env_key)}
+            for name, env_key in GITHUB_ENV_PROPERTIES
+        )
     
     sbom["metadata"]["properties"].extend(slsa_properties)
     
@@ -147,14 +192,16 @@ def generate_enhanced_sbom():
             }
         ])
     
-    return json.dumps(sbom, indent=2)
+    if orjson is not None:
+        return orjson.dumps(sbom, option=orjson.OPT_INDENT_2)
+    return json.dumps(sbom, indent=2).encode()
 
 
 def main():
     """Main function with error handling"""
     try:
         result = generate_enhanced_sbom()
-        print(result)
+        sys.stdout.buffer.write(result + b"\n")
     except KeyboardInterrupt:
         print("\nOperation cancelled by user", file=sys.stderr)
         sys.exit(1)
@@ -4,110 +4,133 @@ import json
 import argparse
 import sys
 import os
+import re
 import subprocess
+import functools
+import shutil
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterator, Optional, Tuple
 from pathlib import Path
 
+try:
+    # Optional: stream scan/SBOM records one at a time instead of loading whole files
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # Optional: faster JSON parsing/serialization than the stdlib json module
+    import orjson
+except ImportError:
+    orjson = None
+
+# Errors raised when a scan or SBOM file is missing, unreadable or not valid JSON
+# (orjson and json decode errors are ValueErrors, ijson has its own hierarchy)
+JSON_LOAD_ERRORS = (OSError, ValueError) + ((ijson.JSONError,) if ijson is not None else ())
+
+# Package name fragments that mark development/test-only dependencies, compiled
+# into one alternation so a package name is scanned once rather than per marker
+DEV_PACKAGE_MARKERS = ("test", "dev", "debug", "mock", "fixture")
+DEV_PACKAGE_PATTERN = re.compile("|".join(DEV_PACKAGE_MARKERS))
+
+# Description phrases for vulnerabilities needing conditions absent in production
+ENVIRONMENT_PATTERNS = (
+    "requires local access", "requires physical access", "denial of service",
+    "information disclosure", "requires authenticated user"
+)
+
+# Title phrases for vulnerabilities in non-executable content
+NON_EXECUTABLE_PATTERNS = ("documentation", "example", "sample")
+
+LOW_SEVERITIES = frozenset(("LOW", "NEGLIGIBLE"))
+HIGH_SEVERITIES = frozenset(("CRITICAL", "HIGH"))
+
+# CVSS sources consulted in order of preference
+CVSS_SOURCES = ("nvd", "redhat", "ubuntu", "ghsa")
+
+
+@functools.lru_cache(maxsize=256)
+def oci_product_identifier(image_ref: Optional[str]) -> str:
+    """Build the OCI PURL used as the VEX product ID for an image reference"""
+    if image_ref:
+        # Always use the full OCI image reference as the main product ID
+        if image_ref.startswith("pkg:"):
+            return image_ref
+        else:
+            # Use the full image reference to match runtime VEX format
+            if image_ref.startswith("ghcr.io/"):
+                # For ghcr.io images, create a PURL that matches Kubescape format
+                return f"pkg:oci/{image_ref.replace('ghcr.io/', '')}"
+            else:
+                return f"pkg:oci/{image_ref}"
+    else:
+        # Without image reference, create a generic OCI PURL for the feelgood-api
+        return f"pkg:oci/feelgood-api@latest"
+
+
+@functools.lru_cache(maxsize=1)
+def find_vexctl() -> Optional[str]:
+    """Locate the vexctl binary once per process"""
+    return shutil.which("vexctl")
+
 
 class VEXGenerator:
     """Enhanced VEX document generator compatible with vexctl and OpenVEX format"""
     
-    def __init__(self):
-        self.vex_states = {
-            "affected": "The vulnerability affects the product",
-            "not_affected": "The vulnerability does not affect the product", 
-            "fixed": "The vulnerability has been fixed",
-            "under_investigation": "Investigation is ongoing"
-        }
-        
-        self.justifications = {
-            "code_not_present": "The vulnerable code is not present in the product",
-            "code_not_reachable": "The vulnerable code is present but not reachable",
-            "requires_configuration": "The vulnerability requires specific configuration",
-            "requires_dependency": "The vulnerability requires a specific dependency",
-            "requires_environment": "The vulnerability requires a specific environment",
-            "protected_by_compiler": "The vulnerability is protected by compiler settings",
-            "protected_at_runtime": "The vulnerability is protected at runtime",
-            "protected_at_perimeter": "The vulnerability is protected at the perimeter",
-            "protected_by_mitigating_control": "The vulnerability is mitigated by controls",
-            "inline_mitigations_already_exist": "Inline mitigations already exist"
-        }
+    # Only per-instance state; the vocabulary tables below live on the class
+    __slots__ = ("author",)
+    
+    # OpenVEX vocabulary descriptions, shared by all instances
+    VEX_STATES = {
+        "affected": "The vulnerability affects the product",
+        "not_affected": "The vulnerability does not affect the product", 
+        "fixed": "The vulnerability has been fixed",
+        "under_investigation": "Investigation is ongoing"
+    }
+    
+    JUSTIFICATIONS = {
+        "code_not_present": "The vulnerable code is not present in the product",
+        "code_not_reachable": "The vulnerable code is present but not reachable",
+        "requires_configuration": "The vulnerability requires specific configuration",
+        "requires_dependency": "The vulnerability requires a specific dependency",
+        "requires_environment": "The vulnerability requires a specific environment",
+        "protected_by_compiler": "The vulnerability is protected by compiler settings",
+        "protected_at_runtime": "The vulnerability is protected at runtime",
+        "protected_at_perimeter": "The vulnerability is protected at the perimeter",
+        "protected_by_mitigating_control": "The vulnerability is mitigated by controls",
+        "inline_mitigations_already_exist": "Inline mitigations already exist"
+    }
 
-        self.response_actions = {
-            "can_not_fix": "Cannot fix the vulnerability",
-            "will_not_fix": "Will not fix the vulnerability",
-            "update": "Update to newer version",
-            "workaround_available": "Workaround is available"
-        }
+    RESPONSE_ACTIONS = {
+        "can_not_fix": "Cannot fix the vulnerability",
+        "will_not_fix": "Will not fix the vulnerability",
+        "update": "Update to newer version",
+        "workaround_available": "Workaround is available"
+    }
+    
+    def __init__(self, author: Optional[str] = None):
+        # Determine author once: explicit argument, then environment, then default
+        self.author = author or os.environ.get("VEX_AUTHOR", "FeelGood API Security Team")
 
-    def analyze_vulnerability(self, vuln: Dict[str, Any], sbom_components: List[Dict], 
-                            image_ref: Optional[str] = None) -> Dict[str, Any]:
+    def analyze_vulnerability(self, vuln: Dict[str, Any], sbom_index: Dict[str, Dict], 
+                            image_ref: Optional[str] = None,
+                            timestamp: Optional[str] = None) -> Dict[str, Any]:
         """Analyze vulnerability against SBOM components to determine exploitability"""
-        vuln_id = vuln.get("VulnerabilityID", "")
         pkg_name = vuln.get("PkgName", "")
         pkg_version = vuln.get("InstalledVersion", "")
         
         # Find matching component in SBOM
-        matching_component = None
-        for comp in sbom_components:
-            if comp.get("name", "") == pkg_name:
-                matching_component = comp
-                break
+        matching_component = sbom_index.get(pkg_name)
         
         # Determine state based on analysis
-        state = "under_investigation"  # Default
-        justification = "requires_configuration"
-        detail = f"Analyzing vulnerability {vuln_id} in component {pkg_name}@{pkg_version}"
-        response = ["will_not_fix"]
-        
-        # Apply enhanced analysis logic
-        severity = vuln.get("Severity", "").upper()
-        title = vuln.get("Title", "").lower()
-        description = vuln.get("Description", "").lower()
-        
-        # Check for development/test dependencies
-        if any(marker in pkg_name.lower() for marker in ["test", "dev", "debug", "mock", "fixture"]):
-            state = "not_affected"
-            justification = "code_not_present"
-            detail = f"Component {pkg_name} is only used in development/testing environments"
-            response = ["will_not_fix"]
-        
-        # Check for low severity vulnerabilities
-        elif severity in ["LOW", "NEGLIGIBLE"]:
-            state = "not_affected" 
-            justification = "protected_by_mitigating_control"
-            detail = f"Low severity vulnerability mitigated by security controls and monitoring"
-            response = ["will_not_fix"]
-        
-        # Check for specific vulnerability patterns that are often not exploitable
-        elif any(pattern in description for pattern in [
-            "requires local access", "requires physical access", "denial of service",
-            "information disclosure", "requires authenticated user"
-        ]):
-            state = "not_affected"
-            justification = "requires_environment"
-            detail = f"Vulnerability requires specific conditions not present in production environment"
-            response = ["will_not_fix"]
-        
-        # Check for vulnerabilities in non-executable content
-        elif any(pattern in title for pattern in ["documentation", "example", "sample"]):
-            state = "not_affected"
-            justification = "code_not_present"
-            detail = f"Vulnerability in non-executable content"
-            response = ["will_not_fix"]
+        state, justification, detail, response = self.classify_vulnerability(
+            vuln, pkg_name, pkg_version
+        )
         
-        # High/Critical vulnerabilities require investigation
-        elif severity in ["CRITICAL", "HIGH"]:
-            state = "under_investigation"
-            justification = "requires_configuration"
-            detail = f"High/Critical severity vulnerability requires detailed analysis"
-            response = ["can_not_fix", "update"]
-        
-        # Check if there's a fixed version available
-        fixed_version = vuln.get("FixedVersion", "")
-        if fixed_version and fixed_version != "":
-            if state != "not_affected":  # Don't override not_affected status
+        # Check if there's a fixed version available; not_affected is final
+        if state != "not_affected":
+            fixed_version = vuln.get("FixedVersion", "")
+            if fixed_version:
                 state = "affected"
                 response = ["update"]
                 detail += f". Fixed in version {fixed_version}"
@@ -117,127 +140,193 @@ class VEXGenerator:
             "justification": justification,
             "response": response,
             "detail": detail,
-            "analysis_timestamp": datetime.now().astimezone().isoformat()
+            "analysis_timestamp": timestamp or datetime.now().astimezone().isoformat()
         }
 
+    def classify_vulnerability(self, vuln: Dict[str, Any], pkg_name: str,
+                               pkg_version: str) -> Tuple[str, str, str, List[str]]:
+        """Classify a vulnerability as (state, justification, detail, response)
+        
+        Checks run in priority order and return on the first match, so the title
+        and description are only lowercased when no earlier check applies.
+        """
+        # Check for development/test dependencies
+        if DEV_PACKAGE_PATTERN.search(pkg_name.lower()):
+            return ("not_affected", "code_not_present",
+                    f"Component {pkg_name} is only used in development/testing environments",
+                    ["will_not_fix"])
+        
+        # Check for low severity vulnerabilities
+        severity = vuln.get("Severity", "").upper()
+        if severity in LOW_SEVERITIES:
+            return ("not_affected", "protected_by_mitigating_control",
+                    "Low severity vulnerability mitigated by security controls and monitoring",
+                    ["will_not_fix"])
+        
+        # Check for specific vulnerability patterns that are often not exploitable
+        description = vuln.get("Description", "").lower()
+        if any(pattern in description for pattern in ENVIRONMENT_PATTERNS):
+            return ("not_affected", "requires_environment",
+                    "Vulnerability requires specific conditions not present in production environment",
+                    ["will_not_fix"])
+        
+        # Check for vulnerabilities in non-executable content
+        title = vuln.get("Title", "").lower()
+        if any(pattern in title for pattern in NON_EXECUTABLE_PATTERNS):
+            return ("not_affected", "code_not_present",
+                    "Vulnerability in non-executable content",
+                    ["will_not_fix"])
+        
+        # High/Critical vulnerabilities require investigation
+        if severity in HIGH_SEVERITIES:
+            return ("under_investigation", "requires_configuration",
+                    "High/Critical severity vulnerability requires detailed analysis",
+                    ["can_not_fix", "update"])
+        
+        # Default
+        vuln_id = vuln.get("VulnerabilityID", "")
+        return ("under_investigation", "requires_configuration",
+                f"Analyzing vulnerability {vuln_id} in component {pkg_name}@{pkg_version}",
+                ["will_not_fix"])
+
     def create_product_identifier(self, image_ref: Optional[str], pkg_name: str, pkg_version: str) -> str:
         """Create a proper product identifier (PURL format) - always use OCI format for consistency"""
-        if image_ref:
-            # Always use the full OCI image reference as the main product ID
-            if image_ref.startswith("pkg:"):
-                return image_ref
+        # The identifier depends only on the image, so every package shares one cache entry
+        return oci_product_identifier(image_ref)
+
+    def iter_trivy_vulnerabilities(self, trivy_file: Path) -> Iterator[Dict[str, Any]]:
+        """Yield Trivy vulnerabilities across all Results one at a time"""
+        with open(trivy_file, "rb") as f:
+            if ijson is not None:
+                yield from ijson.items(f, "Results.item.Vulnerabilities.item", use_float=True)
             else:
-                # Use the full image reference to match runtime VEX format
-                if image_ref.startswith("ghcr.io/"):
-                    # For ghcr.io images, create a PURL that matches Kubescape format
-                    return f"pkg:oci/{image_ref.replace('ghcr.io/', '')}"
-                else:
-                    return f"pkg:oci/{image_ref}"
-        else:
-            # Without image reference, create a generic OCI PURL for the feelgood-api
-            return f"pkg:oci/feelgood-api@latest"
+                trivy_data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+                for result in trivy_data.get("Results") or []:
+                    yield from result.get("Vulnerabilities") or []
+
+    def load_sbom_index(self, sbom_file: Path) -> Dict[str, Dict]:
+        """Index SBOM components by name; the first component with a name wins"""
+        sbom_index: Dict[str, Dict] = {}
+        with open(sbom_file, "rb") as f:
+            if ijson is not None:
+                components = ijson.items(f, "components.item", use_float=True)
+            else:
+                sbom_data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+                components = sbom_data.get("components", [])
+            for comp in components:
+                sbom_index.setdefault(comp.get("name", ""), comp)
+        return sbom_index
 
     def generate_vex_from_trivy(self, trivy_file: Path, sbom_file: Optional[Path] = None, 
                                image_ref: Optional[str] = None) -> Dict[str, Any]:
         """Generate OpenVEX-compatible document from Trivy scan results and SBOM"""
         
-        # Load Trivy results
+        # Load SBOM if provided
+        sbom_index = {}
+        if sbom_file:
+            try:
+                sbom_index = self.load_sbom_index(sbom_file)
+            except FileNotFoundError:
+                pass
+            except JSON_LOAD_ERRORS as e:
+                print(f"Warning: Error loading SBOM: {e}", file=sys.stderr)
+        
+        # One timestamp shared by the document and all of its statements
+        now = datetime.now().astimezone()
+        timestamp = now.isoformat()
+        
+        # Stream Trivy results, keeping each distinct vulnerability. The same
+        # package can be reported once per image layer; only the first is kept.
+        vulnerabilities = {}
         try:
-            with open(trivy_file) as f:
-                trivy_data = json.load(f)
-        except Exception as e:
+            for vuln in self.iter_trivy_vulnerabilities(trivy_file):
+                key = (vuln.get("VulnerabilityID", ""), vuln.get("PkgName", ""),
+                       vuln.get("InstalledVersion", ""))
+                vulnerabilities.setdefault(key, vuln)
+        except JSON_LOAD_ERRORS as e:
             print(f"Error loading Trivy results: {e}", file=sys.stderr)
             return self.generate_default_vex(image_ref)
         
-        # Load SBOM if provided
-        sbom_components = []
-        if sbom_file and sbom_file.exists():
-            try:
-                with open(sbom_file) as f:
-                    sbom_data = json.load(f)
-                    sbom_components = sbom_data.get("components", [])
-            except Exception as e:
-                print(f"Warning: Error loading SBOM: {e}", file=sys.stderr)
+        # Analysis errors propagate instead of being reported as load errors
+        statements = [self.create_statement(vuln, sbom_index, image_ref, timestamp)
+                      for vuln in vulnerabilities.values()]
         
-        statements = []
+        return self.create_openvex_document(statements, image_ref, now)
+
+    def create_statement(self, vuln: Dict[str, Any], sbom_index: Dict[str, Dict],
+                         image_ref: Optional[str], timestamp: str) -> Dict[str, Any]:
+        """Create the OpenVEX statement for a single Trivy vulnerability"""
+        analysis = self.analyze_vulnerability(vuln, sbom_index, image_ref, timestamp)
+        pkg_name = vuln.get("PkgName", "")
+        pkg_version = vuln.get("InstalledVersion", "")
         
-        # Process Trivy results
-        for result in trivy_data.get("Results", []):
-            target = result.get("Target", "")
-            
-            for vuln in result.get("Vulnerabilities", []):
-                analysis = self.analyze_vulnerability(vuln, sbom_components, image_ref)
-                pkg_name = vuln.get("PkgName", "")
-                pkg_version = vuln.get("InstalledVersion", "")
-                
-                # Create product identifier
-                if image_ref:
-                    product_id = self.create_product_identifier(image_ref, pkg_name, pkg_version)
-                else:
-                    product_id = self.create_product_identifier(None, pkg_name, pkg_version)
-                
-                statement = {
-                    "vulnerability": {
-                        "name": vuln.get("VulnerabilityID", "")
-                    },
-                    "timestamp": datetime.now().astimezone().isoformat(),
-                    "products": [
-                        {
-                            "@id": product_id
-                        }
-                    ],
-                    "status": analysis["state"]
+        # Create product identifier
+        if image_ref:
+            product_id = self.create_product_identifier(image_ref, pkg_name, pkg_version)
+        else:
+            product_id = self.create_product_identifier(None, pkg_name, pkg_version)
+        
+        statement = {
+            "vulnerability": {
+                "name": vuln.get("VulnerabilityID", "")
+            },
+            "timestamp": timestamp,
+            "products": [
+                {
+                    "@id": product_id
                 }
-                
-                # Add optional fields based on status
-                if analysis["justification"]:
-                    statement["justification"] = analysis["justification"]
-                
-                if analysis.get("detail"):
-                    statement["detail"] = analysis["detail"]
-                
-                # Add action statements for non-affected vulnerabilities
-                if analysis["state"] == "not_affected" and analysis.get("response"):
-                    statement["action_statement"] = analysis["response"][0]
-                
-                # Add impact assessment for affected vulnerabilities
-                if analysis["state"] == "affected":
-                    cvss_score = self.extract_cvss_score(vuln)
-                    if cvss_score > 0:
-                        statement["impact_statement"] = f"CVSS Score: {cvss_score}"
-                
-                statements.append(statement)
+            ],
+            "status": analysis["state"]
+        }
+        
+        # Add optional fields based on status
+        if analysis["justification"]:
+            statement["justification"] = analysis["justification"]
+        
+        if analysis.get("detail"):
+            statement["detail"] = analysis["detail"]
+        
+        # Add action statements for non-affected vulnerabilities
+        if analysis["state"] == "not_affected" and analysis.get("response"):
+            statement["action_statement"] = analysis["response"][0]
+        
+        # Add impact assessment for affected vulnerabilities
+        if analysis["state"] == "affected":
+            cvss_score = self.extract_cvss_score(vuln)
+            if cvss_score > 0:
+                statement["impact_statement"] = f"CVSS Score: {cvss_score}"
         
-        return self.create_openvex_document(statements, image_ref)
+        return statement
 
     def extract_cvss_score(self, vuln: Dict[str, Any]) -> float:
         """Extract CVSS score from vulnerability data"""
-        cvss = vuln.get("CVSS", {})
+        cvss = vuln.get("CVSS")
+        if not cvss:
+            return 0.0
         
         # Try different CVSS sources
-        for source in ["nvd", "redhat", "ubuntu", "ghsa"]:
-            if source in cvss:
-                score = cvss[source].get("V3Score") or cvss[source].get("V2Score")
-                if score:
-                    return float(score)
+        for source in CVSS_SOURCES:
+            scores = cvss.get(source)
+            if scores and (score := scores.get("V3Score") or scores.get("V2Score")):
+                return float(score)
         
         return 0.0
 
     def create_openvex_document(self, statements: List[Dict[str, Any]], 
-                               image_ref: Optional[str] = None) -> Dict[str, Any]:
+                               image_ref: Optional[str] = None,
+                               now: Optional[datetime] = None) -> Dict[str, Any]:
         """Create a complete OpenVEX-compatible document"""
         
-        # Generate document ID
-        doc_id = f"https://openvex.dev/docs/public/vex-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        now = now or datetime.now().astimezone()
         
-        # Determine author from environment or default
-        author = os.environ.get("VEX_AUTHOR", "FeelGood API Security Team")
+        # Generate document ID
+        doc_id = f"https://openvex.dev/docs/public/vex-{now.strftime('%Y%m%d%H%M%S')}"
         
         doc = {
             "@context": "https://openvex.dev/ns/v0.2.0",
             "@id": doc_id,
-            "author": author,
-            "timestamp": datetime.now().astimezone().isoformat(),
+            "author": self.author,
+            "timestamp": now.isoformat(),
             "version": 1,
             "statements": statements
         }
@@ -255,12 +344,14 @@ class VEXGenerator:
         if image_ref and not image_ref.startswith("pkg:"):
             product_id = self.create_product_identifier(image_ref, "feelgood-api", "1.0.0")
         
+        now = datetime.now().astimezone()
+        
         statements = [
             {
                 "vulnerability": {
                     "name": "PLACEHOLDER-VEX"
                 },
-                "timestamp": datetime.now().astimezone().isoformat(),
+                "timestamp": now.isoformat(),
                 "products": [
                     {
                         "@id": product_id
@@ -272,25 +363,29 @@ class VEXGenerator:
             }
         ]
         
-        return self.create_openvex_document(statements, image_ref)
+        return self.create_openvex_document(statements, image_ref, now)
 
     def validate_with_vexctl(self, vex_file: Path) -> bool:
         """Validate VEX document using vexctl if available"""
+        return self.validate_many_with_vexctl([vex_file])
+
+    def validate_many_with_vexctl(self, vex_files: List[Path]) -> bool:
+        """Validate VEX documents with a single vexctl invocation where possible"""
+        vexctl = find_vexctl()
+        if vexctl is None:
+            print("Warning: vexctl not found - skipping validation", file=sys.stderr)
+            return True  # Don't fail if vexctl isn't available
+        
         try:
-            # Check if vexctl is available
-            result = subprocess.run(["vexctl", "version"], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode != 0:
-                print("Warning: vexctl not available for validation", file=sys.stderr)
-                return True  # Don't fail if vexctl isn't available
-            
-            # Validate the VEX document
-            result = subprocess.run(["vexctl", "validate", str(vex_file)], 
+            result = subprocess.run([vexctl, "validate", *map(str, vex_files)], 
                                   capture_output=True, text=True, timeout=30)
             
             if result.returncode == 0:
                 print(f"✅ VEX document validated successfully with vexctl")
                 return True
+            elif len(vex_files) > 1:
+                # vexctl may not accept several paths; validate each file on its own
+                return all([self.validate_many_with_vexctl([vex_file]) for vex_file in vex_files])
             else:
                 print(f"❌ VEX validation failed: {result.stderr}", file=sys.stderr)
                 return False
@@ -298,9 +393,6 @@ class VEXGenerator:
         except subprocess.TimeoutExpired:
             print("Warning: vexctl validation timed out", file=sys.stderr)
             return True
-        except FileNotFoundError:
-            print("Warning: vexctl not found - skipping validation", file=sys.stderr)
-            return True
         except Exception as e:
             print(f"Warning: vexctl validation error: {e}", file=sys.stderr)
             return True
@@ -317,11 +409,7 @@ def main():
     
     args = parser.parse_args()
     
-    # Set author if provided
-    if args.author:
-        os.environ["VEX_AUTHOR"] = args.author
-    
-    generator = VEXGenerator()
+    generator = VEXGenerator(author=args.author)
     
     if args.trivy_results and args.trivy_results.exists():
         vex_doc = generator.generate_vex_from_trivy(
@@ -332,10 +420,14 @@ def main():
     else:
         vex_doc = generator.generate_default_vex(args.image_ref)
     
-    vex_json = json.dumps(vex_doc, indent=2)
+    # Serialize straight to bytes so the document is never held as a str as well
+    if orjson is not None:
+        vex_json = orjson.dumps(vex_doc, option=orjson.OPT_INDENT_2)
+    else:
+        vex_json = json.dumps(vex_doc, indent=2).encode()
     
     if args.output:
-        with open(args.output, 'w') as f:
+        with open(args.output, 'wb') as f:
             f.write(vex_json)
         
         print(f"📄 VEX document written to {args.output}")
@@ -345,7 +437,7 @@ def main():
             if not generator.validate_with_vexctl(args.output):
                 sys.exit(1)
     else:
-        print(vex_json)
+        sys.stdout.buffer.write(vex_json + b"\n")
 
 
 if __name__ == "__main__":
@@ -1,27 +1,52 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 
-with open('current-sbom.json') as f:
-    current = json.load(f)
-with open('base-sbom.json') as f:
-    base = json.load(f)
+try:
+    # Optional: stream components one at a time instead of loading whole SBOMs
+    import ijson
+except ImportError:
+    ijson = None
 
-current_components = {c['name']: c['version'] for c in current.get('components', [])}
-base_components = {c['name']: c['version'] for c in base.get('components', [])}
+try:
+    # Optional: faster JSON parsing than the stdlib json module
+    import orjson
+except ImportError:
+    orjson = None
 
-added = set(current_components.keys()) - set(base_components.keys())
-removed = set(base_components.keys()) - set(current_components.keys())
-changed = {k for k in base_components if k in current_components and base_components[k] != current_components[k]}
+
+def load_components(path):
+    """Map component name to version for every component in an SBOM file"""
+    with open(path, 'rb') as f:
+        if ijson is not None:
+            components = ijson.items(f, 'components.item')
+        else:
+            sbom = orjson.loads(f.read()) if orjson is not None else json.load(f)
+            components = sbom.get('components', [])
+        return {c['name']: c['version'] for c in components}
+
+
+# Load both SBOMs concurrently
+with ThreadPoolExecutor(max_workers=2) as executor:
+    current_future = executor.submit(load_components, 'current-sbom.json')
+    base_future = executor.submit(load_components, 'base-sbom.json')
+    current_components = current_future.result()
+    base_components = base_future.result()
+
+added = current_components.keys() - base_components.keys()
+removed = base_components.keys() - current_components.keys()
+changed = [k for k in base_components.keys() & current_components.keys()
+           if base_components[k] != current_components[k]]
+
+sections = []
+if added:
+    sections.append('**Added:**\n')
+    sections.extend(f'- {pkg} {current_components[pkg]}\n' for pkg in added)
+if removed:
+    sections.append('\n**Removed:**\n')
+    sections.extend(f'- {pkg} {base_components[pkg]}\n' for pkg in removed)
+if changed:
+    sections.append('\n**Updated:**\n')
+    sections.extend(f'- {pkg}: {base_components[pkg]} → {current_components[pkg]}\n' for pkg in changed)
 
 with open('sbom_diff.txt', 'w') as out:
-    if added:
-        out.write('**Added:**\n')
-        for pkg in added:
-            out.write(f'- {pkg} {current_components[pkg]}\n')
-    if removed:
-        out.write('\n**Removed:**\n')
-        for pkg in removed:
-            out.write(f'- {pkg} {base_components[pkg]}\n')
-    if changed:
-        out.write('\n**Updated:**\n')
-        for pkg in changed:
-            out.write(f'- {pkg}: {base_components[pkg]} → {current_components[pkg]}\n') 
\ No newline at end of file
+    out.write(''.join(sections))
@@ -1,14 +1,78 @@
 #!/usr/bin/env python3
 """Enhanced SLSA attestation and signature verification"""
 import subprocess
+import io
 import json
 import sys
 import argparse
 import re
 import shlex
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Optional
 from pathlib import Path
 
+try:
+    # Optional: summarize large attestation payloads without building the full document
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # Optional: faster JSON parsing/serialization than the stdlib json module
+    import orjson
+except ImportError:
+    orjson = None
+
+# Errors raised for malformed attestation JSON (json/orjson raise ValueErrors)
+JSON_DECODE_ERRORS = (ValueError,) + ((ijson.JSONError,) if ijson is not None else ())
+
+# Provenance event prefix -> provenance summary field
+PROVENANCE_SUMMARY_FIELDS = {
+    "predicate.builder.id": "builder_id",
+    "predicate.buildType": "build_type",
+    "predicate.invocation.configSource.uri": "source_uri",
+    "predicate.invocation.configSource.entryPoint": "entry_point"
+}
+
+# ijson events carrying a scalar value, and events that start any JSON value
+# (the latter are used to count array items)
+SCALAR_EVENTS = frozenset(("string", "number", "boolean", "null"))
+VALUE_START_EVENTS = SCALAR_EVENTS | {"start_map", "start_array"}
+
+# OCI image reference: registry/namespace/name:tag or registry/namespace/name@sha256:digest
+IMAGE_REF_PATTERN = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9\-\.]*[a-zA-Z0-9])?(/[a-zA-Z0-9]([a-zA-Z0-9\-\._]*[a-zA-Z0-9])?)*(@sha256:[a-f0-9]{64}|:[a-zA-Z0-9]([a-zA-Z0-9\-\._]*[a-zA-Z0-9])?)$')
+
+# GitHub repository: owner/repo
+REPOSITORY_PATTERN = re.compile(r'^[a-zA-Z0-9][a-zA-Z0-9\-]*[a-zA-Z0-9]/[a-zA-Z0-9][a-zA-Z0-9\-\._]*[a-zA-Z0-9]$')
+
+# slsa-verifier source URI: github.com/owner/repo
+GITHUB_SOURCE_URI_PATTERN = re.compile(r'^github\.com/[a-zA-Z0-9][a-zA-Z0-9\-]*[a-zA-Z0-9]/[a-zA-Z0-9][a-zA-Z0-9\-\._]*[a-zA-Z0-9]$')
+
+
+def iter_json_events(value, prefix: str = ""):
+    """Yield ijson-style (prefix, event, value) parse events for a parsed JSON document"""
+    if isinstance(value, dict):
+        yield prefix, "start_map", None
+        for key, item in value.items():
+            yield prefix, "map_key", key
+            yield from iter_json_events(item, f"{prefix}.{key}" if prefix else key)
+        yield prefix, "end_map", None
+    elif isinstance(value, list):
+        yield prefix, "start_array", None
+        item_prefix = f"{prefix}.item" if prefix else "item"
+        for item in value:
+            yield from iter_json_events(item, item_prefix)
+        yield prefix, "end_array", None
+    elif value is None:
+        yield prefix, "null", None
+    elif isinstance(value, bool):
+        yield prefix, "boolean", value
+    elif isinstance(value, (int, float)):
+        yield prefix, "number", value
+    else:
+        yield prefix, "string", value
+
 
 class AttestationVerifier:
     """Verify SLSA attestations and container signatures"""
@@ -21,27 +85,31 @@ class AttestationVerifier:
         "max_command_timeout": 120
     }
     
+    # Anchored, escaped OIDC issuer regexp passed to cosign
+    TRUSTED_ISSUER_PATTERN = f"^{re.escape(VERIFICATION_CONFIG['trusted_issuers'][0])}$"
+    
     def __init__(self, image_ref: str, repository: str = "plamen/feelgood-api"):
         self.image_ref = self._validate_image_ref(image_ref)
         self.repository = self._validate_repository(repository)
-        self.verified_components = []
+        self._certificate_identity_pattern = self._build_certificate_identity_pattern()
+        # Insertion-ordered set: O(1) membership, reported in verification order
+        self.verified_components: dict[str, None] = {}
+        # Verification command results (in flight or finished), keyed by command
+        self._verifications: dict[tuple[str, ...], Future] = {}
     
     def _validate_image_ref(self, image_ref: str) -> str:
         """Validate and sanitize OCI image reference"""
         if not image_ref or not isinstance(image_ref, str):
             raise ValueError("Image reference must be a non-empty string")
         
-        # Validate OCI image reference format
-        # Supports: registry/namespace/name:tag or registry/namespace/name@sha256:digest
-        pattern = r'^[a-zA-Z0-9]([a-zA-Z0-9\-\.]*[a-zA-Z0-9])?(/[a-zA-Z0-9]([a-zA-Z0-9\-\._]*[a-zA-Z0-9])?)*(@sha256:[a-f0-9]{64}|:[a-zA-Z0-9]([a-zA-Z0-9\-\._]*[a-zA-Z0-9])?)$'
-        
-        if not re.match(pattern, image_ref):
-            raise ValueError(f"Invalid OCI image reference format: {image_ref}")
-        
-        # Additional length check to prevent buffer overflow attacks
+        # Length check first, so oversized input never reaches the regex engine
         if len(image_ref) > 512:
             raise ValueError("Image reference too long")
         
+        # Validate OCI image reference format
+        if not IMAGE_REF_PATTERN.match(image_ref):
+            raise ValueError(f"Invalid OCI image reference format: {image_ref}")
+        
         return image_ref
     
     def _validate_repository(self, repository: str) -> str:
@@ -50,9 +118,7 @@ class AttestationVerifier:
             raise ValueError("Repository must be a non-empty string")
         
         # Validate GitHub repo format: owner/repo
-        pattern = r'^[a-zA-Z0-9][a-zA-Z0-9\-]*[a-zA-Z0-9]/[a-zA-Z0-9][a-zA-Z0-9\-\._]*[a-zA-Z0-9]$'
-        
-        if not re.match(pattern, repository):
+        if not REPOSITORY_PATTERN.match(repository):
             raise ValueError(f"Invalid GitHub repository format: {repository}")
         
         if repository not in self.VERIFICATION_CONFIG["allowed_repos"]:
@@ -60,12 +126,17 @@ class AttestationVerifier:
         
         return repository
     
-    def _get_certificate_identity_pattern(self) -> str:
-        """Get repository-specific certificate identity pattern"""
+    def _build_certificate_identity_pattern(self) -> str:
+        """Build the repository-specific certificate identity pattern"""
         escaped_repo = re.escape(self.repository)
         return f"^https://github\.com/{escaped_repo}/\.github/workflows/.*@refs/.*"
     
-    def _safe_subprocess_run(self, cmd: list[str], timeout: int = None) -> subprocess.CompletedProcess:
+    def _get_certificate_identity_pattern(self) -> str:
+        """Get repository-specific certificate identity pattern"""
+        return self._certificate_identity_pattern
+    
+    def _safe_subprocess_run(self, cmd: list[str], timeout: int = None,
+                             capture_stdout: bool = True) -> subprocess.CompletedProcess:
         """Safely execute subprocess with proper validation and timeouts"""
         if not cmd or not isinstance(cmd, list):
             raise ValueError("Command must be a non-empty list")
@@ -80,10 +151,11 @@ class AttestationVerifier:
         timeout = timeout or self.VERIFICATION_CONFIG["max_command_timeout"]
         
         try:
-            return subprocess.run(
+            result = subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                # Checks that only need the exit status discard stdout instead of buffering it
+                stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=timeout,
                 check=False  # We handle return codes manually
             )
@@ -91,23 +163,79 @@ class AttestationVerifier:
             raise RuntimeError(f"Command timed out after {timeout} seconds")
         except Exception as e:
             raise RuntimeError(f"Subprocess execution failed: {e}")
-    
-    def verify_signature(self) -> bool:
-        """Verify container signature with Cosign"""
-        print(f"🔍 Verifying signature for {self.image_ref}")
-        
-        cert_pattern = self._get_certificate_identity_pattern()
-        issuer_pattern = self.VERIFICATION_CONFIG["trusted_issuers"][0]
         
-        cmd = [
+        # stdout stays raw bytes for the JSON parser; only stderr is shown to users
+        result.stderr = result.stderr.decode(errors="replace")
+        return result
+    
+    def _run_verification(self, cmd: list[str], capture_stdout: bool = True) -> subprocess.CompletedProcess:
+        """Run a verification command once per verifier, reusing its result afterwards"""
+        key = tuple(cmd)
+        future = self._verifications.get(key)
+        if future is None:
+            future = self._verifications[key] = Future()
+            try:
+                future.set_result(self._safe_subprocess_run(cmd, capture_stdout=capture_stdout))
+            except (ValueError, RuntimeError) as e:
+                future.set_exception(e)
+        return future.result()
+    
+    def _signature_command(self) -> list[str]:
+        """Build the cosign command verifying the container signature"""
+        return [
             "cosign", "verify",
-            "--certificate-identity-regexp", cert_pattern,
-            "--certificate-oidc-issuer-regexp", f"^{re.escape(issuer_pattern)}$",
+            "--certificate-identity-regexp", self._get_certificate_identity_pattern(),
+            "--certificate-oidc-issuer-regexp", self.TRUSTED_ISSUER_PATTERN,
+            self.image_ref
+        ]
+    
+    def _attestation_command(self, predicate_type: str, identity_pattern: Optional[str] = None) -> list[str]:
+        """Build the cosign command verifying one attestation predicate type"""
+        return [
+            "cosign", "verify-attestation",
+            "--type", predicate_type,
+            "--certificate-identity-regexp", identity_pattern or self._get_certificate_identity_pattern(),
+            "--certificate-oidc-issuer-regexp", self.TRUSTED_ISSUER_PATTERN,
             self.image_ref
         ]
+    
+    def _slsa_verifier_command(self, source_uri: str) -> list[str]:
+        """Build the slsa-verifier command for a source repository"""
+        return [
+            "slsa-verifier", "verify-image",
+            self.image_ref,
+            "--source-uri", source_uri
+        ]
+    
+    def _is_valid_source_uri(self, source_uri: str) -> bool:
+        """Check a source URI has the github.com/owner/repo form"""
+        return isinstance(source_uri, str) and GITHUB_SOURCE_URI_PATTERN.match(source_uri) is not None
+    
+    def start_verifications(self, executor: Executor, source_uri: Optional[str] = None):
+        """Start the attestation verification commands concurrently; the verify_* methods collect the results"""
+        # (command, whether its stdout is parsed)
+        commands = [
+            (self._attestation_command("slsaprovenance", self.VERIFICATION_CONFIG["slsa_generator_pattern"]), True),
+            (self._attestation_command("https://slsa.dev/provenance/v1"), False),
+            (self._attestation_command("cyclonedx"), True),
+            (self._attestation_command("openvex"), True)
+        ]
+        if source_uri and self._is_valid_source_uri(source_uri):
+            commands.append((self._slsa_verifier_command(source_uri), False))
+        
+        for cmd, capture_stdout in commands:
+            key = tuple(cmd)
+            if key not in self._verifications:
+                self._verifications[key] = executor.submit(
+                    self._safe_subprocess_run, cmd, capture_stdout=capture_stdout
+                )
+    
+    def verify_signature(self) -> bool:
+        """Verify container signature with Cosign"""
+        print(f"🔍 Verifying signature for {self.image_ref}")
         
         try:
-            result = self._safe_subprocess_run(cmd)
+            result = self._run_verification(self._signature_command(), capture_stdout=False)
         except (ValueError, RuntimeError) as e:
             print(f"❌ Signature verification failed: {e}")
             return False
@@ -117,7 +245,7 @@ class AttestationVerifier:
             return False
         
         print("✅ Container signature verified")
-        self.verified_components.append("signature")
+        self.verified_components["signature"] = None
         return True
     
     def verify_slsa_provenance(self) -> bool:
@@ -125,18 +253,10 @@ class AttestationVerifier:
         print(f"🔍 Verifying SLSA provenance for {self.image_ref}")
         
         slsa_pattern = self.VERIFICATION_CONFIG["slsa_generator_pattern"]
-        issuer_pattern = self.VERIFICATION_CONFIG["trusted_issuers"][0]
-        
-        cmd = [
-            "cosign", "verify-attestation",
-            "--type", "slsaprovenance",
-            "--certificate-identity-regexp", slsa_pattern,
-            "--certificate-oidc-issuer-regexp", f"^{re.escape(issuer_pattern)}$",
-            self.image_ref
-        ]
+        cmd = self._attestation_command("slsaprovenance", slsa_pattern)
         
         try:
-            result = self._safe_subprocess_run(cmd)
+            result = self._run_verification(cmd)
         except (ValueError, RuntimeError) as e:
             print(f"❌ SLSA provenance verification failed: {e}")
             return False
@@ -146,14 +266,17 @@ class AttestationVerifier:
             return False
         
         print("✅ SLSA provenance verified")
-        self.verified_components.append("slsa-provenance")
+        self.verified_components["slsa-provenance"] = None
         
         # Parse and display provenance details
         try:
-            attestation = json.loads(result.stdout)
-            self._display_provenance_summary(attestation)
-        except json.JSONDecodeError:
+            summary = self._summarize_provenance(result.stdout)
+        except JSON_DECODE_ERRORS:
+            summary = None
+        if summary is None:
             print("⚠️ Could not parse provenance attestation")
+        else:
+            self._display_provenance_summary(summary)
         
         return True
     
@@ -167,19 +290,12 @@ class AttestationVerifier:
             return False
         
         # Basic GitHub URI validation
-        github_pattern = r'^github\.com/[a-zA-Z0-9][a-zA-Z0-9\-]*[a-zA-Z0-9]/[a-zA-Z0-9][a-zA-Z0-9\-\._]*[a-zA-Z0-9]$'
-        if not re.match(github_pattern, source_uri):
+        if not self._is_valid_source_uri(source_uri):
             print(f"❌ Invalid GitHub source URI format: {source_uri}")
             return False
         
-        cmd = [
-            "slsa-verifier", "verify-image",
-            self.image_ref,
-            "--source-uri", source_uri
-        ]
-        
         try:
-            result = self._safe_subprocess_run(cmd)
+            result = self._run_verification(self._slsa_verifier_command(source_uri), capture_stdout=False)
         except (ValueError, RuntimeError) as e:
             print(f"❌ SLSA verifier failed: {e}")
             return False
@@ -189,26 +305,17 @@ class AttestationVerifier:
             return False
         
         print("✅ SLSA verifier validation passed")
-        self.verified_components.append("slsa-verifier")
+        self.verified_components["slsa-verifier"] = None
         return True
     
     def verify_github_attestations(self) -> bool:
         """Verify GitHub native attestations"""
         print(f"🔍 Verifying GitHub attestations for {self.image_ref}")
         
-        cert_pattern = self._get_certificate_identity_pattern()
-        issuer_pattern = self.VERIFICATION_CONFIG["trusted_issuers"][0]
-        
-        cmd = [
-            "cosign", "verify-attestation",
-            "--type", "https://slsa.dev/provenance/v1",
-            "--certificate-identity-regexp", cert_pattern,
-            "--certificate-oidc-issuer-regexp", f"^{re.escape(issuer_pattern)}$",
-            self.image_ref
-        ]
-        
         try:
-            result = self._safe_subprocess_run(cmd)
+            result = self._run_verification(
+                self._attestation_command("https://slsa.dev/provenance/v1"), capture_stdout=False
+            )
         except (ValueError, RuntimeError) as e:
             print(f"⚠️ GitHub attestations verification failed: {e}")
             return False
@@ -218,7 +325,7 @@ class AttestationVerifier:
             return False
         
         print("✅ GitHub attestations verified")
-        self.verified_components.append("github-attestations")
+        self.verified_components["github-attestations"] = None
         return True
     
     def verify_multi_layer_sboms(self) -> bool:
@@ -235,81 +342,74 @@ class AttestationVerifier:
         verified_sboms = []
         sbom_details = {}
         
+        # Every layer is looked up in the same cyclonedx attestation bundle, so
+        # verify and parse it once; failure is an (icon, message) reported per layer
+        sboms = []
+        failure = None
+        try:
+            result = self._run_verification(self._attestation_command("cyclonedx"))
+        except (ValueError, RuntimeError) as e:
+            failure = ("❌", f"Verification failed - {e}")
+        else:
+            if result.returncode != 0:
+                failure = ("⚠️", "No attestation found")
+            # Validate JSON size before parsing
+            elif len(result.stdout) > 10 * 1024 * 1024:  # 10MB limit
+                failure = ("❌", "Response too large")
+            else:
+                try:
+                    sboms = self._summarize_sbom_attestations(result.stdout)
+                except JSON_DECODE_ERRORS as e:
+                    failure = ("❌", f"Invalid JSON in attestation - {e}")
+                else:
+                    if sboms is None:
+                        failure = ("❌", "Invalid attestation format")
+        
+        # Classify the attestations in a single pass; each layer takes the first
+        # attestation it matches, and the pass stops once every layer is found
+        layer_sboms = {}
+        if not failure:
+            for sbom in sboms:
+                props = sbom["properties"]
+                layer = props.get("slsa:layer")
+                
+                for sbom_type in sbom_types:
+                    if sbom_type in layer_sboms:
+                        continue
+                    # Check if this SBOM matches our type
+                    layer_match = layer == sbom_type
+                    
+                    # For consolidated SBOM, check for layer_types property
+                    if sbom_type == "consolidated" and "build-time" in props.get("sbom:layer_types", ""):
+                        layer_match = True
+                    
+                    # If no specific layer info, consider it for build-time or container
+                    if layer_match or sbom_type in ["build-time", "container"]:
+                        layer_sboms[sbom_type] = sbom
+                
+                if len(layer_sboms) == len(sbom_types):
+                    break
+        
         for sbom_type, description in sbom_types.items():
             print(f"  🔍 Checking {description}...")
             
-            cert_pattern = self._get_certificate_identity_pattern()
-            issuer_pattern = self.VERIFICATION_CONFIG["trusted_issuers"][0]
-            
-            cmd = [
-                "cosign", "verify-attestation",
-                "--type", "cyclonedx",
-                "--certificate-identity-regexp", cert_pattern,
-                "--certificate-oidc-issuer-regexp", f"^{re.escape(issuer_pattern)}$",
-                self.image_ref
-            ]
+            if failure:
+                print(f"    {failure[0]} {description}: {failure[1]}")
+                continue
             
-            try:
-                result = self._safe_subprocess_run(cmd)
-            except (ValueError, RuntimeError) as e:
-                print(f"    ❌ {description}: Verification failed - {e}")
+            sbom = layer_sboms.get(sbom_type)
+            if sbom is None:
+                print(f"    ⚠️ {description}: Not found or no matching layer info")
                 continue
             
-            if result.returncode == 0:
-                try:
-                    # Validate JSON size before parsing
-                    if len(result.stdout) > 10 * 1024 * 1024:  # 10MB limit
-                        print(f"    ❌ {description}: Response too large")
-                        continue
-                    
-                    attestations = json.loads(result.stdout)
-                    if not isinstance(attestations, list):
-                        print(f"    ❌ {description}: Invalid attestation format")
-                        continue
-                    # Look for SBOM that matches our type based on metadata
-                    for attestation in attestations:
-                        predicate = attestation.get("predicate", {})
-                        metadata = predicate.get("metadata", {})
-                        properties = metadata.get("properties", [])
-                        
-                        # Check if this SBOM matches our type
-                        layer_match = False
-                        for prop in properties:
-                            if (prop.get("name") == "slsa:layer" and 
-                                prop.get("value") == sbom_type.replace("-", "-")):
-                                layer_match = True
-                                break
-                        
-                        # For consolidated SBOM, check for layer_types property
-                        if sbom_type == "consolidated":
-                            for prop in properties:
-                                if (prop.get("name") == "sbom:layer_types" and 
-                                    "build-time" in prop.get("value", "")):
-                                    layer_match = True
-                                    break
-                        
-                        # If no specific layer info, consider it for build-time or container
-                        if not layer_match and sbom_type in ["build-time", "container"]:
-                            layer_match = True
-                        
-                        if layer_match:
-                            components = predicate.get("components", [])
-                            component_count = len(components)
-                            sbom_details[sbom_type] = {
-                                "components": component_count,
-                                "format": predicate.get("bomFormat", "Unknown"),
-                                "spec_version": predicate.get("specVersion", "Unknown")
-                            }
-                            verified_sboms.append(sbom_type)
-                            print(f"    ✅ {description}: {component_count} components")
-                            break
-                    else:
-                        print(f"    ⚠️ {description}: Not found or no matching layer info")
-                        
-                except (json.JSONDecodeError, ValueError) as e:
-                    print(f"    ❌ {description}: Invalid JSON in attestation - {e}")
-            else:
-                print(f"    ⚠️ {description}: No attestation found")
+            component_count = sbom["components"]
+            sbom_details[sbom_type] = {
+                "components": component_count,
+                "format": sbom["format"],
+                "spec_version": sbom["spec_version"]
+            }
+            verified_sboms.append(sbom_type)
+            print(f"    ✅ {description}: {component_count} components")
         
         if verified_sboms:
             print(f"\n📊 SBOM Verification Summary:")
@@ -319,7 +419,7 @@ class AttestationVerifier:
                 print(f"     📦 Components: {details.get('components', 'Unknown')}")
                 print(f"     📋 Format: {details.get('format', 'Unknown')} v{details.get('spec_version', 'Unknown')}")
             
-            self.verified_components.extend([f"sbom-{sbom}" for sbom in verified_sboms])
+            self.verified_components.update(dict.fromkeys(f"sbom-{sbom}" for sbom in verified_sboms))
             print(f"✅ Multi-layer SBOM verification: {len(verified_sboms)}/{len(sbom_types)} types verified")
             return True
         else:
@@ -330,19 +430,8 @@ class AttestationVerifier:
         """Verify VEX attestations"""
         print(f"🛡️ Verifying VEX attestations for {self.image_ref}")
         
-        cert_pattern = self._get_certificate_identity_pattern()
-        issuer_pattern = self.VERIFICATION_CONFIG["trusted_issuers"][0]
-        
-        cmd = [
-            "cosign", "verify-attestation",
-            "--type", "openvex",
-            "--certificate-identity-regexp", cert_pattern,
-            "--certificate-oidc-issuer-regexp", f"^{re.escape(issuer_pattern)}$",
-            self.image_ref
-        ]
-        
         try:
-            result = self._safe_subprocess_run(cmd)
+            result = self._run_verification(self._attestation_command("openvex"))
         except (ValueError, RuntimeError) as e:
             print(f"⚠️ VEX attestations verification failed: {e}")
             return False
@@ -357,55 +446,149 @@ class AttestationVerifier:
                 print("❌ VEX attestation response too large")
                 return False
             
-            attestations = json.loads(result.stdout)
-            if not isinstance(attestations, list):
+            counts = self._count_vex_statements(result.stdout)
+            if counts is None:
                 print("❌ Invalid VEX attestation format")
                 return False
             
-            total_statements = 0
-            
-            for attestation in attestations:
-                if not isinstance(attestation, dict):
-                    continue
-                predicate = attestation.get("predicate", {})
-                statements = predicate.get("statements", [])
-                if isinstance(statements, list):
-                    total_statements += len(statements)
-            
-            print(f"✅ VEX attestations verified: {total_statements} statements across {len(attestations)} documents")
-            self.verified_components.append("vex-attestations")
+            total_statements, documents = counts
+            print(f"✅ VEX attestations verified: {total_statements} statements across {documents} documents")
+            self.verified_components["vex-attestations"] = None
             return True
             
-        except (json.JSONDecodeError, ValueError) as e:
+        except JSON_DECODE_ERRORS as e:
             print(f"❌ Invalid VEX attestation JSON: {e}")
             return False
     
-    def _display_provenance_summary(self, attestation: dict):
+    def _parse_attestations(self, data: bytes):
+        """Parse a cosign attestation list into Python objects"""
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    
+    def _attestation_events(self, data: bytes):
+        """Parse events for an attestation payload: streamed by ijson, or from the parsed document"""
+        if ijson is not None:
+            return ijson.parse(io.BytesIO(data), use_float=True)
+        return iter_json_events(self._parse_attestations(data))
+    
+    def _starts_with(self, events, expected_event: str) -> bool:
+        """Check the first parse event; on a mismatch the rest is still parsed so malformed JSON raises"""
+        if next(events)[1] == expected_event:
+            return True
+        for _ in events:
+            pass
+        return False
+    
+    def _summarize_sbom_attestations(self, data: bytes) -> Optional[list[dict]]:
+        """Summarize each SBOM attestation's properties, component count and format; None if not a list"""
+        # Walk the parse events, keeping only the few fields reported per SBOM
+        events = self._attestation_events(data)
+        if not self._starts_with(events, "start_array"):
+            return None
+        
+        summaries = []
+        summary = prop = None
+        for prefix, event, value in events:
+            if prefix == "item":
+                # Attestations that are not objects are skipped
+                if event == "start_map":
+                    summary = {"properties": {}, "components": 0, "format": "Unknown", "spec_version": "Unknown"}
+                elif event == "end_map":
+                    summaries.append(summary)
+                    summary = None
+            elif summary is None:
+                continue
+            elif prefix == "item.predicate.components.item":
+                if event in VALUE_START_EVENTS:
+                    summary["components"] += 1
+            elif prefix == "item.predicate.bomFormat":
+                if event in SCALAR_EVENTS:
+                    summary["format"] = value
+            elif prefix == "item.predicate.specVersion":
+                if event in SCALAR_EVENTS:
+                    summary["spec_version"] = value
+            elif prefix == "item.predicate.metadata.properties.item":
+                if event == "start_map":
+                    prop = {}
+                elif event == "end_map":
+                    # Properties may omit value; only string values are kept
+                    summary["properties"][prop.get("name")] = prop.get("value", "")
+                    prop = None
+            elif prop is None:
+                continue
+            elif prefix == "item.predicate.metadata.properties.item.name":
+                if event in SCALAR_EVENTS:
+                    prop["name"] = value
+            elif prefix == "item.predicate.metadata.properties.item.value":
+                if event == "string":
+                    prop["value"] = value
+        return summaries
+    
+    def _count_vex_statements(self, data: bytes) -> Optional[tuple[int, int]]:
+        """Count VEX statements and documents in an attestation list; None if not a list"""
+        # Walk the parse events, counting items without building the statements
+        events = self._attestation_events(data)
+        if not self._starts_with(events, "start_array"):
+            return None
+        
+        total_statements = documents = 0
+        for prefix, event, _ in events:
+            if event in VALUE_START_EVENTS:
+                if prefix == "item":
+                    documents += 1
+                elif prefix == "item.predicate.statements.item":
+                    total_statements += 1
+        return total_statements, documents
+    
+    def _summarize_provenance(self, data: bytes) -> Optional[dict]:
+        """Extract the fields shown in the provenance summary; None if not an object"""
+        summary = {
+            "builder_id": "Unknown",
+            "build_type": "Unknown",
+            "source_uri": "Unknown",
+            "entry_point": "Unknown",
+            "materials": 0,
+            "material_uris": []
+        }
+        
+        # Walk the parse events, keeping only the shown fields and first 3 material URIs
+        events = self._attestation_events(data)
+        if not self._starts_with(events, "start_map"):
+            return None
+        
+        for prefix, event, value in events:
+            if prefix in PROVENANCE_SUMMARY_FIELDS:
+                if event in SCALAR_EVENTS:
+                    summary[PROVENANCE_SUMMARY_FIELDS[prefix]] = value
+            elif prefix == "predicate.materials.item":
+                # Materials that are not objects count, but have no URI to show
+                if event in VALUE_START_EVENTS:
+                    summary["materials"] += 1
+                    if summary["materials"] <= 3:
+                        summary["material_uris"].append("Unknown")
+            elif prefix == "predicate.materials.item.uri" and summary["materials"] <= 3:
+                if event in SCALAR_EVENTS:
+                    summary["material_uris"][-1] = value
+        return summary
+    
+    def _display_provenance_summary(self, summary: dict):
         """Display a summary of the provenance attestation"""
         print("\n📋 Provenance Summary:")
         
-        # Extract key information
-        builder_id = attestation.get("predicate", {}).get("builder", {}).get("id", "Unknown")
-        build_type = attestation.get("predicate", {}).get("buildType", "Unknown")
-        
-        invocation = attestation.get("predicate", {}).get("invocation", {})
-        config_source = invocation.get("configSource", {})
-        
-        print(f"  🏗️  Builder: {builder_id}")
-        print(f"  🔧 Build Type: {build_type}")
-        print(f"  📂 Source URI: {config_source.get('uri', 'Unknown')}")
-        print(f"  🎯 Entry Point: {config_source.get('entryPoint', 'Unknown')}")
+        print(f"  🏗️  Builder: {summary['builder_id']}")
+        print(f"  🔧 Build Type: {summary['build_type']}")
+        print(f"  📂 Source URI: {summary['source_uri']}")
+        print(f"  🎯 Entry Point: {summary['entry_point']}")
         
         # Display materials (dependencies)
-        materials = attestation.get("predicate", {}).get("materials", [])
+        materials = summary["materials"]
         if materials:
-            print(f"  📦 Materials: {len(materials)} components")
-            for material in materials[:3]:  # Show first 3
-                print(f"    - {material.get('uri', 'Unknown')}")
-            if len(materials) > 3:
-                print(f"    ... and {len(materials) - 3} more")
+            print(f"  📦 Materials: {materials} components")
+            for uri in summary["material_uris"]:  # Show first 3
+                print(f"    - {uri}")
+            if materials > 3:
+                print(f"    ... and {materials - 3} more")
     
-    def generate_verification_report(self) -> dict:
+    def generate_verification_report(self, skipped_due_to_signature_failure: bool = False) -> dict:
         """Generate a verification report"""
         # Assess SLSA level based on verified components
         slsa_level = "unknown"
@@ -420,22 +603,16 @@ class AttestationVerifier:
             else:
                 slsa_level = "2+"  # SLSA Level 2 with provenance
         
-        # Safe timestamp generation
-        try:
-            timestamp_result = self._safe_subprocess_run(["date", "-Iseconds"], timeout=10)
-            timestamp = timestamp_result.stdout.strip() if timestamp_result.returncode == 0 else "unknown"
-        except (ValueError, RuntimeError):
-            timestamp = "unknown"
-        
         return {
             "image": self.image_ref,
             "repository": self.repository,
-            "timestamp": timestamp,
-            "verified_components": self.verified_components,
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "verified_components": list(self.verified_components),
             "slsa_level": slsa_level,
             "sbom_layers_verified": len(sbom_components),
             "has_vex_attestations": has_vex,
             "has_runtime_filtered_sbom": "sbom-runtime-filtered" in self.verified_components,
+            "skipped_due_to_signature_failure": skipped_due_to_signature_failure,
             "status": "verified" if self.verified_components else "failed"
         }
 
@@ -458,34 +635,44 @@ def main():
     # Run all verifications
     all_passed = True
     
-    # Verify signature
-    if not verifier.verify_signature():
-        all_passed = False
-    
-    # Verify SLSA provenance
-    if not verifier.verify_slsa_provenance():
+    # Verify signature first. Attestations on an image whose signature does not
+    # verify are not checked, so their commands are never started.
+    signature_verified = verifier.verify_signature()
+    if not signature_verified:
         all_passed = False
-    
-    # Verify with SLSA verifier if source URI provided
-    if args.source_uri:
-        if not verifier.verify_with_slsa_verifier(args.source_uri):
-            all_passed = False
-    
-    # Try to verify GitHub attestations
-    verifier.verify_github_attestations()  # Don't fail on this
-    
-    # Verify multi-layer SBOMs for SLSA Level 3+ compliance
-    print("\n" + "="*60)
-    if not verifier.verify_multi_layer_sboms():
-        print("⚠️ Multi-layer SBOM verification failed, but continuing...")
-    
-    # Verify VEX attestations
-    print("\n" + "="*60)
-    if not verifier.verify_vex_attestations():
-        print("⚠️ VEX attestation verification failed, but continuing...")
+        print("⏭️ Skipping attestation verification: container signature not verified")
+    else:
+        # The remaining commands are network-bound and independent, so they are
+        # started together up front; results are reported in order below.
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            verifier.start_verifications(executor, args.source_uri)
+            
+            # Verify SLSA provenance
+            if not verifier.verify_slsa_provenance():
+                all_passed = False
+            
+            # Verify with SLSA verifier if source URI provided
+            if args.source_uri:
+                if not verifier.verify_with_slsa_verifier(args.source_uri):
+                    all_passed = False
+            
+            # Try to verify GitHub attestations
+            verifier.verify_github_attestations()  # Don't fail on this
+            
+            # Verify multi-layer SBOMs for SLSA Level 3+ compliance
+            print("\n" + "="*60)
+            if not verifier.verify_multi_layer_sboms():
+                print("⚠️ Multi-layer SBOM verification failed, but continuing...")
+            
+            # Verify VEX attestations
+            print("\n" + "="*60)
+            if not verifier.verify_vex_attestations():
+                print("⚠️ VEX attestation verification failed, but continuing...")
     
     # Generate report
-    report = verifier.generate_verification_report()
+    report = verifier.generate_verification_report(
+        skipped_due_to_signature_failure=not signature_verified
+    )
     
     if args.report:
         try:
@@ -495,8 +682,12 @@ def main():
                 print(f"❌ Report directory does not exist: {report_path.parent}")
                 sys.exit(1)
             
-            with open(report_path, 'w') as f:
-                json.dump(report, f, indent=2)
+            if orjson is not None:
+                with open(report_path, 'wb') as f:
+                    f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+            else:
+                with open(report_path, 'w') as f:
+                    json.dump(report, f, indent=2)
             print(f"\n📄 Verification report saved to {report_path}")
         except (OSError, ValueError) as e:
             print(f"❌ Failed to save report: {e}")
@@ -1,14 +1,51 @@
 """Feel Good Phrases API - Main Application"""
 
+import json
+import os
 from contextlib import asynccontextmanager
 from datetime import datetime
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
 from pydantic import BaseModel
 
-from .phrases import PhraseGenerator
+from .phrases import ALL_PHRASES, PhraseGenerator
+
+# Supply chain documents baked into the image at build time
+SBOM_PATH = "/app/sbom.json"
+VEX_PATH = "/app/vex.json"
+
+# Static parts of the /health and /security/provenance bodies, timestamps are
+# filled in per request
+BUILD_INFO = {
+    "python_version": "3.11",
+    "build_date": None,
+    "sbom_generated": "true",
+    "slsa_level": "3",
+}
+
+PROVENANCE = {
+    "builder": "github-actions",
+    "buildType": "https://github.com/slsa-framework/slsa-github-generator",
+    "invocation": {
+        "configSource": {
+            "uri": "https://github.com/plpetkov-tech/feelgood-api",
+            "digest": {"sha1": "placeholder"},
+            "entryPoint": ".github/workflows/build-and-security.yml",
+        }
+    },
+    "metadata": {
+        "buildInvocationId": "placeholder",
+        "buildStartedOn": None,
+        "completeness": {
+            "parameters": True,
+            "environment": True,
+            "materials": True,
+        },
+        "reproducible": True,
+    },
+}
 
 
 class HealthResponse(BaseModel):
@@ -35,6 +72,18 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     # Startup
     app.state.phrase_generator = PhraseGenerator()
+    # Categories never change, so their response body is serialized once
+    app.state.categories_body = json.dumps(
+        app.state.phrase_generator.get_categories(), separators=(",", ":")
+    ).encode()
+    # Static start of each /phrase body, only the timestamp is appended per request
+    app.state.phrase_body_prefixes = {
+        (phrase, category): json.dumps(
+            {"phrase": phrase, "category": category}, separators=(",", ":")
+        )[:-1].encode()
+        + b',"timestamp":"'
+        for phrase, category in ALL_PHRASES
+    }
     print("Feel Good API started with supply chain security features")
     yield
     # Shutdown
@@ -89,17 +138,13 @@ async def root():
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint with build information"""
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.now(),
-        version="1.0.0",
-        build_info={
-            "python_version": "3.11",
-            "build_date": datetime.now().isoformat(),
-            "sbom_generated": "true",
-            "slsa_level": "3",
-        },
-    )
+    now = datetime.now()
+    return {
+        "status": "healthy",
+        "timestamp": now,
+        "version": "1.0.0",
+        "build_info": {**BUILD_INFO, "build_date": now.isoformat()},
+    }
 
 
 @app.get("/phrase", response_model=PhraseResponse)
@@ -107,17 +152,17 @@ async def get_phrase(category: str = ""):
     """Get a random feel-good phrase"""
     try:
         phrase, used_category = app.state.phrase_generator.get_phrase(category)
-        return PhraseResponse(
-            phrase=phrase, category=used_category, timestamp=datetime.now()
-        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    body = app.state.phrase_body_prefixes[phrase, used_category]
+    timestamp = datetime.now().isoformat().encode()
+    return Response(content=body + timestamp + b'"}', media_type="application/json")
 
 
 @app.get("/phrases/categories", response_model=list[str])
 async def get_categories():
     """Get all available phrase categories"""
-    return app.state.phrase_generator.get_categories()
+    return Response(content=app.state.categories_body, media_type="application/json")
 
 
 @app.get("/security", response_model=SecurityHeaders)
@@ -133,53 +178,31 @@ async def security_info():
 @app.get("/security/sbom")
 async def get_sbom():
     """Get the Software Bill of Materials"""
-    try:
-        with open("/app/sbom.json") as f:
-            import json
-
-            return JSONResponse(content=json.load(f))
-    except FileNotFoundError:
+    if not os.path.isfile(SBOM_PATH):
         return JSONResponse(
             status_code=404,
             content={"error": "SBOM not found. Generated during build process."},
         )
+    return FileResponse(SBOM_PATH, media_type="application/json")
 
 
 @app.get("/security/vex")
 async def get_vex():
     """Get the Vulnerability Exploitability eXchange document"""
-    try:
-        with open("/app/vex.json") as f:
-            import json
-
-            return JSONResponse(content=json.load(f))
-    except FileNotFoundError:
+    if not os.path.isfile(VEX_PATH):
         return JSONResponse(
             status_code=404, content={"error": "VEX document not found."}
         )
+    return FileResponse(VEX_PATH, media_type="application/json")
 
 
 @app.get("/security/provenance")
 async def get_provenance():
     """Get SLSA provenance information"""
     return {
-        "builder": "github-actions",
-        "buildType": "https://github.com/slsa-framework/slsa-github-generator",
-        "invocation": {
-            "configSource": {
-                "uri": "https://github.com/plpetkov-tech/feelgood-api",
-                "digest": {"sha1": "placeholder"},
-                "entryPoint": ".github/workflows/build-and-security.yml",
-            }
-        },
+        **PROVENANCE,
         "metadata": {
-            "buildInvocationId": "placeholder",
+            **PROVENANCE["metadata"],
             "buildStartedOn": datetime.now().isoformat(),
-            "completeness": {
-                "parameters": True,
-                "environment": True,
-                "materials": True,
-            },
-            "reproducible": True,
         },
     }
@@ -1,58 +1,74 @@
 """Phrase generator module"""
 
 import random
-from typing import Optional
 
+# Phrase catalog, category -> phrases
+PHRASES = {
+    "motivation": (
+        "You are capable of amazing things!",
+        "You're a SALSA mastermind!",
+        "Every day is a new beginning.",
+        "Believe in yourself and all that you are.",
+        "Your potential is endless.",
+        "You've got this!",
+    ),
+    "gratitude": (
+        "Today is a gift, that's why it's called the present.",
+        "Gratitude turns what we have into enough.",
+        "Count your rainbows, not your thunderstorms.",
+        "The little things are the big things.",
+        "Appreciation is a wonderful thing.",
+    ),
+    "kindness": (
+        "Kindness is always fashionable.",
+        "Be the reason someone smiles today.",
+        "A little kindness goes a long way.",
+        "Spread love everywhere you go.",
+        "Your kindness makes a difference.",
+    ),
+    "growth": (
+        "Progress, not perfection.",
+        "Every expert was once a beginner.",
+        "Growth happens outside your comfort zone.",
+        "You're becoming who you're meant to be.",
+        "Small steps lead to big changes.",
+    ),
+}
 
+# Category names in catalog order
+CATEGORIES = tuple(PHRASES)
+
+# Tail of the unknown-category error message
+AVAILABLE_CATEGORIES = f"Available: {list(CATEGORIES)}"
+
+# Every (phrase, category) pair, for picking from the whole catalog in one draw
+ALL_PHRASES = tuple(
+    (phrase, category) for category, phrases in PHRASES.items() for phrase in phrases
+)
+
+
+# Phrases are picked with the random module rather than secrets: the choice is
+# not security sensitive and SystemRandom makes a getrandom() call per draw
 class PhraseGenerator:
     """Generates feel-good phrases by category"""
 
+    __slots__ = ("phrases",)
+
     def __init__(self):
-        self.phrases = {
-            "motivation": [
-                "You are capable of amazing things!",
-                "You're a SALSA mastermind!",
-                "Every day is a new beginning.",
-                "Believe in yourself and all that you are.",
-                "Your potential is endless.",
-                "You've got this!",
-            ],
-            "gratitude": [
-                "Today is a gift, that's why it's called the present.",
-                "Gratitude turns what we have into enough.",
-                "Count your rainbows, not your thunderstorms.",
-                "The little things are the big things.",
-                "Appreciation is a wonderful thing.",
-            ],
-            "kindness": [
-                "Kindness is always fashionable.",
-                "Be the reason someone smiles today.",
-                "A little kindness goes a long way.",
-                "Spread love everywhere you go.",
-                "Your kindness makes a difference.",
-            ],
-            "growth": [
-                "Progress, not perfection.",
-                "Every expert was once a beginner.",
-                "Growth happens outside your comfort zone.",
-                "You're becoming who you're meant to be.",
-                "Small steps lead to big changes.",
-            ],
-        }
-
-    def get_phrase(self, category: Optional[str] = None) -> tuple[str, str]:
+        self.phrases = PHRASES
+
+    def get_phrase(self, category: str | None = None) -> tuple[str, str]:
         """Get a random phrase, optionally from a specific category"""
         if category:
             if category not in self.phrases:
                 raise ValueError(
-                    f"Category '{category}' not found. Available: {list(self.phrases.keys())}"
+                    f"Category '{category}' not found. {AVAILABLE_CATEGORIES}"
                 )
             return random.choice(self.phrases[category]), category
 
-        # Random category if none specified
-        category = random.choice(list(self.phrases.keys()))
-        return random.choice(self.phrases[category]), category
+        # Any phrase from the catalog if no category specified
+        return random.choice(ALL_PHRASES)
 
     def get_categories(self) -> list[str]:
         """Get all available categories"""
-        return list(self.phrases.keys())
+        return list(CATEGORIES)
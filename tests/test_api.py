@@ -6,7 +6,7 @@ from fastapi.testclient import TestClient
 from src.app import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
     """Test client fixture"""
     with TestClient(app) as client:
@@ -47,6 +47,13 @@ def test_get_phrase_with_category(client):
     assert data["category"] == "motivation"
 
 
+def test_get_categories(client):
+    """Test category listing"""
+    response = client.get("/phrases/categories")
+    assert response.status_code == 200
+    assert "motivation" in response.json()
+
+
 def test_get_phrase_invalid_category(client):
     """Test phrase generation with invalid category"""
     response = client.get("/phrase?category=invalid")
@@ -59,3 +66,21 @@ def test_security_headers(client):
     assert "X-Content-Type-Options" in response.headers
     assert "X-Frame-Options" in response.headers
     assert "X-SBOM-Location" in response.headers
+
+
+def test_get_sbom(client, tmp_path, monkeypatch):
+    """Test SBOM is served as stored on disk"""
+    sbom_file = tmp_path / "sbom.json"
+    sbom_file.write_text('{"bomFormat": "CycloneDX"}')
+    monkeypatch.setattr("src.app.SBOM_PATH", str(sbom_file))
+    response = client.get("/security/sbom")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"bomFormat": "CycloneDX"}
+
+
+def test_get_vex_missing(client, monkeypatch):
+    """Test missing VEX document returns 404"""
+    monkeypatch.setattr("src.app.VEX_PATH", "/nonexistent/vex.json")
+    response = client.get("/security/vex")
+    assert response.status_code == 404
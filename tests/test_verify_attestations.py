@@ -0,0 +1,114 @@
+"""Attestation summary tests"""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "verify_attestations.py"
+spec = importlib.util.spec_from_file_location("verify_attestations", SCRIPT)
+verify_attestations = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(verify_attestations)
+
+SBOM_PAYLOAD = json.dumps(
+    [
+        "not an attestation",
+        None,
+        {"predicate": None},
+        {
+            "predicate": {
+                "bomFormat": "CycloneDX",
+                "specVersion": "1.5",
+                "components": [{"name": "a"}, {"name": "b"}],
+                "metadata": {
+                    "properties": [
+                        {"name": "slsa:layer", "value": "container"},
+                        {"name": "sbom:layer_types"},
+                        "not a property",
+                    ]
+                },
+            }
+        },
+    ]
+).encode()
+
+VEX_PAYLOAD = json.dumps(
+    [
+        {"predicate": {"statements": [{}, {}, {}]}},
+        {"predicate": {"statements": "not a list"}},
+        "not an attestation",
+    ]
+).encode()
+
+PROVENANCE_PAYLOAD = json.dumps(
+    {
+        "predicate": {
+            "builder": {"id": "https://github.com/slsa-framework/builder"},
+            "buildType": "https://slsa.dev/container-based-build/v0.1",
+            "invocation": {"configSource": {"uri": "git+https://github.com/o/r"}},
+            "materials": ["not a material", {"uri": "m1"}, {}, {"uri": "m3"}],
+        }
+    }
+).encode()
+
+
+@pytest.fixture(params=["ijson", "document"])
+def verifier(request, monkeypatch):
+    """Verifier reading parse events from ijson or from the parsed document"""
+    if request.param == "ijson":
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr(verify_attestations, "ijson", None)
+    return verify_attestations.AttestationVerifier("ghcr.io/plamen/feelgood-api:v1")
+
+
+def test_summarize_sbom_attestations(verifier):
+    """Test SBOM summaries skip malformed attestations and properties"""
+    assert verifier._summarize_sbom_attestations(SBOM_PAYLOAD) == [
+        {
+            "properties": {},
+            "components": 0,
+            "format": "Unknown",
+            "spec_version": "Unknown",
+        },
+        {
+            "properties": {"slsa:layer": "container", "sbom:layer_types": ""},
+            "components": 2,
+            "format": "CycloneDX",
+            "spec_version": "1.5",
+        },
+    ]
+
+
+def test_summarize_sbom_attestations_not_a_list(verifier):
+    """Test SBOM summary rejects a payload that is not a list"""
+    assert verifier._summarize_sbom_attestations(b'{"predicate": {}}') is None
+
+
+def test_count_vex_statements(verifier):
+    """Test VEX statements are counted across documents"""
+    assert verifier._count_vex_statements(VEX_PAYLOAD) == (3, 3)
+
+
+def test_summarize_provenance(verifier):
+    """Test provenance summary shows the first 3 materials and counts the rest"""
+    assert verifier._summarize_provenance(PROVENANCE_PAYLOAD) == {
+        "builder_id": "https://github.com/slsa-framework/builder",
+        "build_type": "https://slsa.dev/container-based-build/v0.1",
+        "source_uri": "git+https://github.com/o/r",
+        "entry_point": "Unknown",
+        "materials": 4,
+        "material_uris": ["Unknown", "m1", "Unknown"],
+    }
+
+
+def test_summarize_provenance_not_an_object(verifier):
+    """Test provenance summary rejects a payload that is not an object"""
+    assert verifier._summarize_provenance(b"[]") is None
+
+
+def test_malformed_json_raises(verifier):
+    """Test malformed JSON raises rather than reading as the wrong shape"""
+    with pytest.raises(verify_attestations.JSON_DECODE_ERRORS):
+        verifier._count_vex_statements(b"{nope")